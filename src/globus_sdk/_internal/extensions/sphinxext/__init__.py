@@ -8,27 +8,19 @@ import typing as t
 
 from sphinx.application import Sphinx
 
+from . import directives
 from .autodoc_hooks import after_autodoc_signature_replace_MISSING_repr
-from .directives import (
-    AutoMethodList,
-    CopyParams,
-    EnumerateTestingFixtures,
-    ExpandTestingFixture,
-    ExternalDocLink,
-    ListKnownScopes,
-    PaginatedUsage,
-)
 from .roles import extdoclink_role
 
 
 def setup(app: Sphinx) -> dict[str, t.Any]:
-    app.add_directive("automethodlist", AutoMethodList)
-    app.add_directive("listknownscopes", ListKnownScopes)
-    app.add_directive("enumeratetestingfixtures", EnumerateTestingFixtures)
-    app.add_directive("expandtestfixture", ExpandTestingFixture)
-    app.add_directive("extdoclink", ExternalDocLink)
-    app.add_directive("paginatedusage", PaginatedUsage)
-    app.add_directive("sdk-sphinx-copy-params", CopyParams)
+    app.add_directive("automethodlist", directives.AutoMethodList)
+    app.add_directive("listknownscopes", directives.ListKnownScopes)
+    app.add_directive("enumeratetestingfixtures", directives.EnumerateTestingFixtures)
+    app.add_directive("expandtestfixture", directives.ExpandTestingFixture)
+    app.add_directive("extdoclink", directives.ExternalDocLink)
+    app.add_directive("paginatedusage", directives.PaginatedUsage)
+    app.add_directive("sdk-sphinx-copy-params", directives.CopyParams)
 
     app.add_role("extdoclink", extdoclink_role)
 
@@ -1,11 +1,6 @@
-from .add_content_directive import AddContentDirective
-from .automethodlist import AutoMethodList
-from .copy_params import CopyParams
-from .enumerate_testing_fixtures import EnumerateTestingFixtures
-from .expand_testing_fixture import ExpandTestingFixture
-from .externaldoclink import ExternalDocLink
-from .list_known_scopes import ListKnownScopes
-from .paginated_usage import PaginatedUsage
+import importlib
+import sys
+import typing as t
 
 __all__ = (
     "AddContentDirective",
@@ -17,3 +12,38 @@ __all__ = (
     "ListKnownScopes",
     "PaginatedUsage",
 )
+
+# directives are imported lazily
+#
+# this ensures that importing any single directive module (which requires that this
+# package is imported first) does not also import all of the other directives
+if t.TYPE_CHECKING:
+    from .add_content_directive import AddContentDirective
+    from .automethodlist import AutoMethodList
+    from .copy_params import CopyParams
+    from .enumerate_testing_fixtures import EnumerateTestingFixtures
+    from .expand_testing_fixture import ExpandTestingFixture
+    from .externaldoclink import ExternalDocLink
+    from .list_known_scopes import ListKnownScopes
+    from .paginated_usage import PaginatedUsage
+else:
+    _LAZY_IMPORT_TABLE = {
+        "add_content_directive": {"AddContentDirective"},
+        "automethodlist": {"AutoMethodList"},
+        "copy_params": {"CopyParams"},
+        "enumerate_testing_fixtures": {"EnumerateTestingFixtures"},
+        "expand_testing_fixture": {"ExpandTestingFixture"},
+        "externaldoclink": {"ExternalDocLink"},
+        "list_known_scopes": {"ListKnownScopes"},
+        "paginated_usage": {"PaginatedUsage"},
+    }
+
+    def __getattr__(name: str) -> t.Any:
+        for modname, items in _LAZY_IMPORT_TABLE.items():
+            if name in items:
+                mod = importlib.import_module("." + modname, __name__)
+                value = getattr(mod, name)
+                setattr(sys.modules[__name__], name, value)
+                return value
+
+        raise AttributeError(f"module {__name__} has no attribute {name}")
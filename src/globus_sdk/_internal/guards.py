@@ -20,7 +20,7 @@ S = t.TypeVar("S", bound="Serializable")
 
 
 def is_list_of(data: t.Any, typ: type[T]) -> TypeGuard[list[T]]:
-    return isinstance(data, list) and all(isinstance(item, typ) for item in data)
+    return isinstance(data, list) and _all_items_are(data, typ)
 
 
 def is_optional(data: t.Any, typ: type[T]) -> TypeGuard[T | None]:
@@ -28,9 +28,16 @@ def is_optional(data: t.Any, typ: type[T]) -> TypeGuard[T | None]:
 
 
 def is_optional_list_of(data: t.Any, typ: type[T]) -> TypeGuard[list[T] | None]:
-    return data is None or (
-        isinstance(data, list) and all(isinstance(item, typ) for item in data)
-    )
+    return data is None or (isinstance(data, list) and _all_items_are(data, typ))
+
+
+def _all_items_are(data: list[t.Any], typ: type) -> bool:
+    # equivalent to `all(isinstance(item, typ) for item in data)`, but a plain loop
+    # avoids creating a generator, which is significant for these short lists
+    for item in data:
+        if not isinstance(item, typ):
+            return False
+    return True
 
 
 # this class is a namespace, separating validators (which error) from TypeGuards
@@ -83,6 +90,10 @@ class validators:
 
     @staticmethod
     def instance_or_dict(name: str, value: t.Any, cls: type[S]) -> S:
+        # exact dicts are the common case when parsing error documents, so check
+        # for them first with a type identity comparison
+        if type(value) is dict:
+            return cls.from_dict(value)
         if isinstance(value, cls):
             return value
         if isinstance(value, dict):
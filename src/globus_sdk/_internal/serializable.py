@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import inspect
 import sys
 import typing as t
@@ -10,6 +11,26 @@ else:
     from typing_extensions import Self
 
 
+@dataclasses.dataclass(frozen=True)
+class _FieldSchema:
+    """
+    The supported fields of a Serializable class, precomputed in the forms used when
+    loading and dumping data.
+    """
+
+    # the field names, in signature order
+    names: tuple[str, ...]
+    # the same names, as a set for membership tests
+    name_set: frozenset[str]
+    # all field names mapped to None, as a template for initializer kwargs
+    # (this must be copied before it is modified)
+    defaults: dict[str, None]
+
+    @classmethod
+    def from_names(cls, names: tuple[str, ...]) -> _FieldSchema:
+        return cls(names, frozenset(names), dict.fromkeys(names))
+
+
 class Serializable:
     """
     This is a base class for helpers which represent data which can be
@@ -19,19 +40,40 @@ class Serializable:
     - know what fields they have, based on their initializer signatures
     - support `to_dict()` and `from_dict()` conversions
     - typically use `globus_sdk._internal.guards.validators` to check attribute types
+
+    Serializable defines empty ``__slots__`` so that subclasses may opt in to
+    slotted attribute storage. Subclasses which do not define ``__slots__`` will
+    have an instance ``__dict__`` as usual.
     """
 
+    __slots__ = ()
+
     _EXCLUDE_VARS: t.ClassVar[tuple[str, ...]] = ("self", "extra")
+    # the field schema of each class, computed and cached on first use
+    # this is set per-class (never inherited) by `_field_schema()`
+    _FIELD_SCHEMA: t.ClassVar[_FieldSchema | None] = None
     extra: dict[str, t.Any]
 
     @classmethod
-    def _supported_fields(cls) -> list[str]:
-        signature = inspect.signature(cls.__init__)
-        return [
-            name
-            for name in signature.parameters.keys()
-            if name not in cls._EXCLUDE_VARS
-        ]
+    def _field_schema(cls) -> _FieldSchema:
+        # check `cls.__dict__` rather than using attribute lookup, so that a
+        # subclass does not pick up the cached schema of its parent
+        schema: _FieldSchema | None = cls.__dict__.get("_FIELD_SCHEMA")
+        if schema is None:
+            signature = inspect.signature(cls.__init__)
+            schema = _FieldSchema.from_names(
+                tuple(
+                    name
+                    for name in signature.parameters.keys()
+                    if name not in cls._EXCLUDE_VARS
+                )
+            )
+            cls._FIELD_SCHEMA = schema
+        return schema
+
+    @classmethod
+    def _supported_fields(cls) -> tuple[str, ...]:
+        return cls._field_schema().names
 
     @classmethod
     def from_dict(cls, data: dict[str, t.Any]) -> Self:
@@ -41,12 +83,28 @@ class Serializable:
         :param data: The dictionary to create the error from.
         """
 
-        # Extract any extra fields
-        extras = {k: v for k, v in data.items() if k not in cls._supported_fields()}
-        kwargs: dict[str, t.Any] = {"extra": extras}
-        # Ensure required fields are supplied
-        for field_name in cls._supported_fields():
-            kwargs[field_name] = data.get(field_name)
+        schema = cls._field_schema()
+
+        # Ensure required fields are supplied, defaulting to None
+        kwargs: dict[str, t.Any] = schema.defaults.copy()
+        extras: dict[str, t.Any]
+        if len(data) > len(schema.names):
+            # When the data has more keys than there are fields (e.g., an error
+            # document with many extras), it is faster to copy the data and move
+            # the fields out of it than to check every key
+            extras = dict(data)
+            for field_name in schema.names:
+                if field_name in extras:
+                    kwargs[field_name] = extras.pop(field_name)
+        else:
+            # Otherwise, sort the data into fields and extras in a single pass
+            extras = {}
+            for key, value in data.items():
+                if key in schema.name_set:
+                    kwargs[key] = value
+                else:
+                    extras[key] = value
+        kwargs["extra"] = extras
 
         return cls(**kwargs)
 
@@ -68,7 +126,7 @@ class Serializable:
                 result[field] = value
 
         # Set any extra fields
-        if include_extra:
+        if include_extra and self.extra:
             result.update(self.extra)
 
         return result
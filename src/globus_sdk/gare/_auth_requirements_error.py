@@ -45,6 +45,17 @@ class GlobusAuthorizationParameters(Serializable):
     :vartype extra: dict
     """
 
+    __slots__ = (
+        "session_message",
+        "session_required_identities",
+        "session_required_policies",
+        "session_required_single_domain",
+        "session_required_mfa",
+        "required_scopes",
+        "prompt",
+        "extra",
+    )
+
     def __init__(
         self,
         *,
@@ -115,6 +126,8 @@ class GARE(Serializable):
     :vartype extra: dict
     """
 
+    __slots__ = ("code", "authorization_parameters", "extra")
+
     def __init__(
         self,
         code: str,
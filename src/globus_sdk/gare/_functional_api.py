@@ -27,6 +27,14 @@ AnyErrorDocumentType: TypeAlias = (
 
 log = logging.getLogger(__name__)
 
+# legacy error formats which can be converted to GAREs, in order of preference
+_SUPPORTED_LEGACY_VARIANTS: tuple[type[LegacyAuthRequirementsErrorVariant], ...] = (
+    LegacyAuthorizationParametersError,
+    LegacyConsentRequiredTransferError,
+    LegacyConsentRequiredAPError,
+    LegacyDependentConsentRequiredAuthError,
+)
+
 
 def to_gare(error: AnyErrorDocumentType) -> GARE | None:
     """
@@ -89,7 +97,7 @@ def to_gares(errors: list[AnyErrorDocumentType]) -> list[GARE]:
         # only unpack a single result
         if isinstance(error, exc.GlobusAPIError):
             # Use the ErrorSubdocuments when handling API error types
-            maybe_gares.extend(to_gare(e) for e in error.errors)
+            maybe_gares.extend(map(to_gare, error.errors))
             # Also use the root document, but only if there is an `"errors"`
             # key inside of the error document
             # Why? Because the *default* for `.errors` when there is no inner
@@ -120,22 +128,19 @@ def _lenient_dict2gare(error_dict: dict[str, t.Any] | None) -> GARE | None:
         return None
 
     # Prefer a proper auth requirements error, if possible
+    #
+    # failed parses are expected here, so log messages are formatted lazily
+    # rather than built on every attempt
     try:
         return GARE.from_dict(error_dict)
     except exc.ValidationError as err:
-        log.debug(f"Failed to parse error as 'GARE' ({err})")
-
-    supported_variants: list[type[LegacyAuthRequirementsErrorVariant]] = [
-        LegacyAuthorizationParametersError,
-        LegacyConsentRequiredTransferError,
-        LegacyConsentRequiredAPError,
-        LegacyDependentConsentRequiredAuthError,
-    ]
-    for variant in supported_variants:
+        log.debug("Failed to parse error as 'GARE' (%s)", err)
+
+    for variant in _SUPPORTED_LEGACY_VARIANTS:
         try:
             return variant.from_dict(error_dict).to_auth_requirements_error()
         except exc.ValidationError as err:
-            log.debug(f"Failed to parse error as '{variant.__name__}' ({err})")
+            log.debug("Failed to parse error as '%s' (%s)", variant.__name__, err)
 
     return None
 
@@ -157,4 +162,4 @@ def has_gares(errors: list[AnyErrorDocumentType]) -> bool:
 
     :param errors: The errors to check.
     """
-    return any(is_gare(error) for error in errors)
+    return any(map(is_gare, errors))
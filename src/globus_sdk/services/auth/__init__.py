@@ -1,26 +1,6 @@
-from .client import (
-    AuthClient,
-    AuthLoginClient,
-    ConfidentialAppAuthClient,
-    NativeAppAuthClient,
-)
-from .data import DependentScopeSpec
-from .errors import AuthAPIError
-from .flow_managers import (
-    GlobusAuthorizationCodeFlowManager,
-    GlobusNativeAppFlowManager,
-)
-from .id_token_decoder import IDTokenDecoder
-from .identity_map import IdentityMap
-from .response import (
-    GetConsentsResponse,
-    GetIdentitiesResponse,
-    OAuthAuthorizationCodeResponse,
-    OAuthClientCredentialsResponse,
-    OAuthDependentTokenResponse,
-    OAuthRefreshTokenResponse,
-    OAuthTokenResponse,
-)
+import importlib
+import sys
+import typing as t
 
 __all__ = (
     # client classes
@@ -46,3 +26,69 @@ __all__ = (
     "OAuthRefreshTokenResponse",
     "OAuthTokenResponse",
 )
+
+# imports are done lazily
+#
+# this ensures that importing any one component of the Auth subpackage (e.g. the
+# response classes) does not import all of the others, and that importing this
+# package does not eagerly import `requests` or `jwt`
+if t.TYPE_CHECKING:
+    from .client import (
+        AuthClient,
+        AuthLoginClient,
+        ConfidentialAppAuthClient,
+        NativeAppAuthClient,
+    )
+    from .data import DependentScopeSpec
+    from .errors import AuthAPIError
+    from .flow_managers import (
+        GlobusAuthorizationCodeFlowManager,
+        GlobusNativeAppFlowManager,
+    )
+    from .id_token_decoder import IDTokenDecoder
+    from .identity_map import IdentityMap
+    from .response import (
+        GetConsentsResponse,
+        GetIdentitiesResponse,
+        OAuthAuthorizationCodeResponse,
+        OAuthClientCredentialsResponse,
+        OAuthDependentTokenResponse,
+        OAuthRefreshTokenResponse,
+        OAuthTokenResponse,
+    )
+else:
+    _LAZY_IMPORT_TABLE = {
+        "client": {
+            "AuthClient",
+            "AuthLoginClient",
+            "ConfidentialAppAuthClient",
+            "NativeAppAuthClient",
+        },
+        "data": {"DependentScopeSpec"},
+        "errors": {"AuthAPIError"},
+        "flow_managers": {
+            "GlobusAuthorizationCodeFlowManager",
+            "GlobusNativeAppFlowManager",
+        },
+        "id_token_decoder": {"IDTokenDecoder"},
+        "identity_map": {"IdentityMap"},
+        "response": {
+            "GetConsentsResponse",
+            "GetIdentitiesResponse",
+            "OAuthAuthorizationCodeResponse",
+            "OAuthClientCredentialsResponse",
+            "OAuthDependentTokenResponse",
+            "OAuthRefreshTokenResponse",
+            "OAuthTokenResponse",
+        },
+    }
+
+    def __getattr__(name: str) -> t.Any:
+        for modname, items in _LAZY_IMPORT_TABLE.items():
+            if name in items:
+                mod = importlib.import_module("." + modname, __name__)
+                value = getattr(mod, name)
+                setattr(sys.modules[__name__], name, value)
+                return value
+
+        raise AttributeError(f"module {__name__} has no attribute {name}")
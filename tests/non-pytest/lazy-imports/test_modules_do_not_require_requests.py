@@ -32,6 +32,9 @@ PYTHON_BINARY = os.environ.get("GLOBUS_TEST_PY", sys.executable)
         # the top-level of the 'exc' subpackage (but not necessarily its contents)
         # should similarly be standalone, for exception handlers
         "exc",
+        # the top-level of the 'services.auth' subpackage is similarly standalone,
+        # so that importing one of its components does not import all of them
+        "services.auth",
         # internal components and utilities are a special case:
         # failing to ensure that these avoid 'requests' can make it more difficult
         # to ensure that the main parts (above) do not transitively pick it up
@@ -21,3 +21,23 @@ def test_attribute_error_on_bad_name():
     assert (
         str(err) == "module globus_sdk has no attribute DEIMOS_DOWN_REMOVE_ALL_PLANTS"
     )
+
+
+def test_auth_subpackage_attribute_error_on_bad_name():
+    import globus_sdk.services.auth
+
+    with pytest.raises(AttributeError) as excinfo:
+        globus_sdk.services.auth.DEIMOS_DOWN_REMOVE_ALL_PLANTS
+
+    err = excinfo.value
+    assert str(err) == (
+        "module globus_sdk.services.auth has no attribute "
+        "DEIMOS_DOWN_REMOVE_ALL_PLANTS"
+    )
+
+
+def test_auth_subpackage_lazy_attributes_match_all():
+    import globus_sdk.services.auth
+
+    for name in globus_sdk.services.auth.__all__:
+        assert getattr(globus_sdk.services.auth, name).__name__ == name
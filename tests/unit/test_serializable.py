@@ -0,0 +1,92 @@
+import pytest
+
+from globus_sdk._internal.serializable import Serializable
+
+
+class Parent(Serializable):
+    def __init__(self, *, foo=None, extra=None) -> None:
+        self.foo = foo
+        self.extra = extra or {}
+
+
+class Child(Parent):
+    def __init__(self, *, foo=None, bar=None, extra=None) -> None:
+        super().__init__(foo=foo, extra=extra)
+        self.bar = bar
+
+
+def test_supported_fields_are_read_from_init_signature():
+    assert Parent._supported_fields() == ("foo",)
+    assert Child._supported_fields() == ("foo", "bar")
+    assert Parent._field_schema().name_set == frozenset(("foo",))
+    assert Child._field_schema().name_set == frozenset(("foo", "bar"))
+    assert Child._field_schema().defaults == {"foo": None, "bar": None}
+
+
+def test_supported_fields_cache_is_not_inherited():
+    # populate the parent cache first, then check that the child computes its own
+    assert Parent._supported_fields() == ("foo",)
+    assert Child._supported_fields() == ("foo", "bar")
+    assert Parent._supported_fields() == ("foo",)
+
+
+def test_from_dict_to_dict_roundtrip_with_extra():
+    data = {"foo": 1, "bar": 2, "baz": 3}
+
+    parent = Parent.from_dict(data)
+    assert parent.foo == 1
+    assert parent.extra == {"bar": 2, "baz": 3}
+    assert parent.to_dict() == {"foo": 1}
+    assert parent.to_dict(include_extra=True) == data
+
+    child = Child.from_dict(data)
+    assert (child.foo, child.bar) == (1, 2)
+    assert child.extra == {"baz": 3}
+    assert child.to_dict() == {"foo": 1, "bar": 2}
+    assert child.to_dict(include_extra=True) == data
+
+
+def test_slotted_subclass_has_no_instance_dict():
+    class Slotted(Serializable):
+        __slots__ = ("foo", "extra")
+
+        def __init__(self, *, foo=None, extra=None) -> None:
+            self.foo = foo
+            self.extra = extra or {}
+
+    x = Slotted.from_dict({"foo": 1, "bar": 2})
+    assert not hasattr(x, "__dict__")
+    assert x.to_dict(include_extra=True) == {"foo": 1, "bar": 2}
+
+
+def test_from_dict_defaults_missing_fields_to_none():
+    # parse a document which sets the field first, to check that no state is
+    # carried over between calls
+    assert Child.from_dict({"foo": 1, "bar": 2}).bar == 2
+
+    child = Child.from_dict({"foo": 1})
+    assert child.bar is None
+    assert child.to_dict() == {"foo": 1}
+
+
+# documents with more keys than fields and those with fewer are parsed differently,
+# so exercise both cases
+@pytest.mark.parametrize(
+    "data",
+    (
+        {},
+        {"foo": 1},
+        {"baz": 3},
+        {"foo": 1, "baz": 3},
+        {"foo": 1, "bar": 2, "baz": 3},
+        {"baz": 3, "qux": 4, "quux": 5},
+    ),
+)
+def test_from_dict_sorts_fields_and_extras(data):
+    original = dict(data)
+    child = Child.from_dict(data)
+    assert child.foo == data.get("foo")
+    assert child.bar == data.get("bar")
+    assert child.extra == {k: v for k, v in data.items() if k not in ("foo", "bar")}
+    # the input is not modified
+    assert data == original